@@ -4,7 +4,33 @@ import pandas as pd
 import numpy as np
 from dataclasses import dataclass
 
-@dataclass
+try:
+    import numba
+except ImportError:  # numba is optional; the kernel runs fine uncompiled
+    numba = None
+
+
+def _bayes_update(mu, inv_var, idx, obs_rating, inv_obs):
+    """
+    In-place Bayesian update of mu/inv_var at positions idx.
+
+    Written as a plain scalar loop so numba can compile it to SIMD
+    code; without numba the NumPy-equivalent vector ops below would
+    be marginally faster, but the loop keeps one shared code path.
+    """
+    for k in range(idx.size):
+        i = idx[k]
+        a = inv_var[i]
+        new_inv = a + inv_obs
+        mu[i] = (mu[i] * a + obs_rating[k] * inv_obs) / new_inv
+        inv_var[i] = new_inv
+
+
+if numba is not None:
+    _bayes_update = numba.njit(cache=True, fastmath=True)(_bayes_update)
+
+
+@dataclass(slots=True, frozen=True)
 class DriverPrior:
     """Prior belief about driver performance."""
     driver_number: str
@@ -22,88 +48,144 @@ class BayesianDriverRanking:
     Update via Bayesian inference.
     """
     
-    def __init__(self, priors):
-        """Initialize with prior beliefs (dict of driver_number -> DriverPrior)."""
-        self.ratings = {}
-        self.n_observations = {}
-        
-        for driver_num, prior in priors.items():
-            self.ratings[driver_num] = (prior.mu, prior.sigma)
-            self.n_observations[driver_num] = 0
-        
+    def __init__(self, priors, log_updates=True):
+        """
+        Initialize with prior beliefs (dict of driver_number -> DriverPrior).
+
+        log_updates: keep a per-driver audit trail of every update.
+        Set False for large Monte-Carlo replays where the log would
+        dominate memory and runtime.
+        """
+        # Structure-of-arrays storage: one index per driver, ratings in
+        # parallel float arrays so session updates are vectorized NumPy ops.
+        self.driver_index = {num: i for i, num in enumerate(priors)}
+        self.driver_nums = np.array(list(priors.keys()))
+        self.driver_codes = np.array([p.driver_code for p in priors.values()])
+        self.teams = np.array([p.team for p in priors.values()])
+        # float32 is plenty for ratings on a 1-21 scale with sigma ~3-7,
+        # and halves the bandwidth of every update/predict pass
+        self.mu = np.array([p.mu for p in priors.values()], dtype=np.float32)
+        # Canonical uncertainty state is the precision 1/sigma^2; sigma is
+        # derived lazily so updates never re-square or re-root per driver.
+        self.inv_var = 1.0 / np.array([p.sigma for p in priors.values()], dtype=np.float32)**2
+        self.n_obs = np.zeros(len(priors), dtype=np.int32)
+
         self.priors = priors
-        self.update_history = []
-    
+        self.log_updates = log_updates
+        # Update log kept as fixed-layout tuples; materialized into a
+        # DataFrame only on demand in get_update_summary.
+        self._hist_rows: list[tuple] = []
+        self._hist_cols = ('session', 'driver_number', 'driver_code',
+                           'observed_position', 'prior_mu', 'prior_sigma',
+                           'new_mu', 'new_sigma', 'confidence_weight')
+
+    @property
+    def sigma(self):
+        """Per-driver uncertainty, derived from the stored precision."""
+        return 1.0 / np.sqrt(self.inv_var)
+
+    @property
+    def ratings(self):
+        """
+        Read-only dict view of driver_number -> (mu, sigma).
+
+        Compatibility shim for callers written against the old
+        dict-of-tuples storage; hot paths use the arrays directly.
+        """
+        sigma = self.sigma
+        return {num: (float(self.mu[i]), float(sigma[i]))
+                for num, i in self.driver_index.items()}
+
+    @property
+    def n_observations(self):
+        """Read-only dict view of driver_number -> observation count."""
+        return {num: int(self.n_obs[i])
+                for num, i in self.driver_index.items()}
+
     def predict_positions(self):
         """Predict positions based on current ratings."""
-        predictions = []
-        
-        for driver_num, (mu, sigma) in self.ratings.items():
-            # Rating to position: position = 21 - rating
-            predicted_pos = 21 - mu
-            ci_lower = max(1, predicted_pos - 1.96 * sigma)
-            ci_upper = min(20, predicted_pos + 1.96 * sigma)
-            
-            predictions.append({
-                'driver_number': driver_num,
-                'driver_code': self.priors[driver_num].driver_code,
-                'team': self.priors[driver_num].team,
-                'rating_mu': mu,
-                'rating_sigma': sigma,
-                'predicted_position': predicted_pos,
-                'ci_lower': ci_lower,
-                'ci_upper': ci_upper,
-                'n_observations': self.n_observations[driver_num]
-            })
-        
-        df = pd.DataFrame(predictions)
-        df = df.sort_values('predicted_position')
-        df['predicted_rank'] = range(1, len(df) + 1)
-        
+        sigma = self.sigma
+
+        # Rating to position: position = 21 - rating
+        predicted_pos = 21 - self.mu
+        ci_lower = np.clip(predicted_pos - 1.96 * sigma, 1, None)
+        ci_upper = np.clip(predicted_pos + 1.96 * sigma, None, 20)
+
+        # Sort once on the raw array; ranks follow positionally
+        order = np.argsort(predicted_pos, kind='stable')
+
+        df = pd.DataFrame({
+            'driver_number': self.driver_nums[order],
+            'driver_code': self.driver_codes[order],
+            'team': self.teams[order],
+            'rating_mu': self.mu[order],
+            'rating_sigma': sigma[order],
+            'predicted_position': predicted_pos[order],
+            'ci_lower': ci_lower[order],
+            'ci_upper': ci_upper[order],
+            'n_observations': self.n_obs[order],
+            'predicted_rank': np.arange(1, len(order) + 1)
+        }, copy=False)
+
         return df
-    
+
     def update_from_session(self, observed_positions, confidence_weight=1.0, session_name="Session"):
         """
         Update ratings from observed positions.
-        
+
         confidence_weight: How much to trust this observation
         - 0.1 = testing (low trust)
         - 0.3 = practice (medium)
         - 0.8 = sprint quali (high)
         - 1.0 = race (full trust)
         """
-        for driver_num, observed_pos in observed_positions.items():
-            if driver_num not in self.ratings:
-                continue
-            
-            prior_mu, prior_sigma = self.ratings[driver_num]
-            
-            # Position to rating
-            observed_rating = 21 - observed_pos
-            
-            # Observation uncertainty (inversely proportional to confidence)
-            obs_sigma = 5.0 / confidence_weight
-            
-            # Bayesian update
-            new_sigma_sq = 1 / (1/prior_sigma**2 + 1/obs_sigma**2)
-            new_sigma = np.sqrt(new_sigma_sq)
-            new_mu = (prior_mu/prior_sigma**2 + observed_rating/obs_sigma**2) * new_sigma_sq
-            
-            self.ratings[driver_num] = (new_mu, new_sigma)
-            self.n_observations[driver_num] += 1
-            
-            self.update_history.append({
-                'session': session_name,
-                'driver_number': driver_num,
-                'driver_code': self.priors[driver_num].driver_code,
-                'observed_position': observed_pos,
-                'prior_mu': prior_mu,
-                'prior_sigma': prior_sigma,
-                'new_mu': new_mu,
-                'new_sigma': new_sigma,
-                'confidence_weight': confidence_weight
-            })
+        known = [d for d in observed_positions if d in self.driver_index]
+        if not known:
+            return
+
+        idx = np.fromiter((self.driver_index[d] for d in known), dtype=np.int64, count=len(known))
+        obs_pos = np.fromiter((observed_positions[d] for d in known), dtype=np.float64, count=len(known))
+
+        # Position to rating
+        obs_rating = 21 - obs_pos
+
+        # Observation uncertainty (inversely proportional to confidence)
+        obs_sigma = 5.0 / confidence_weight
+
+        if self.log_updates:
+            # Fancy indexing copies, so these survive the in-place kernel
+            prior_mu = self.mu[idx].astype(np.float64)
+            inv_prior = self.inv_var[idx].astype(np.float64)
+
+        # Bayesian update in place; precisions add, so no squaring or
+        # sqrt is needed here
+        inv_obs = 1 / obs_sigma**2
+        _bayes_update(self.mu, self.inv_var, idx, obs_rating, inv_obs)
+        self.n_obs[idx] += 1
+
+        if not self.log_updates:
+            return
+
+        # sigma values only needed for the log, computed on the small
+        # subset and kept at float64 for audit precision
+        new_mu = self.mu[idx].astype(np.float64)
+        new_inv = self.inv_var[idx].astype(np.float64)
+        prior_sigma = 1.0 / np.sqrt(inv_prior)
+        new_sigma = 1.0 / np.sqrt(new_inv)
+
+        for k, driver_num in enumerate(known):
+            self._hist_rows.append((
+                session_name,
+                driver_num,
+                self.priors[driver_num].driver_code,
+                observed_positions[driver_num],
+                prior_mu[k],
+                prior_sigma[k],
+                new_mu[k],
+                new_sigma[k],
+                confidence_weight
+            ))
     
     def get_update_summary(self):
         """Get summary of all updates."""
-        return pd.DataFrame(self.update_history)
+        return pd.DataFrame.from_records(self._hist_rows, columns=self._hist_cols)
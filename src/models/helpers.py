@@ -1,11 +1,76 @@
 """Helper functions for Bayesian prediction."""
 
+import functools
+
 import pandas as pd
 import numpy as np
 from typing import Dict
 from .bayesian import DriverPrior, BayesianDriverRanking
 from .scoring import AbsoluteDifferenceScoring
 
+_PRIOR_ARRAYS_CACHE: dict = {}
+_PRIOR_ONLY_CACHE: dict = {}
+
+def _mu_lut(priors: Dict[str, DriverPrior]) -> dict:
+    """
+    Flat driver_number -> prior mu lookup, shared by the race predictors.
+
+    Stored lazily on the identity-checked _prior_arrays entry, so there
+    is a single cache validating which dict its values came from.
+    """
+    arrays = _prior_arrays(priors)
+    lut = arrays.get('mu_by_driver')
+    if lut is None:
+        lut = dict(zip(arrays['nums'].tolist(), arrays['mu'].tolist()))
+        arrays['mu_by_driver'] = lut
+    return lut
+
+def _prior_arrays(priors: Dict[str, DriverPrior]) -> dict:
+    """
+    NumPy views of a priors dict, built once per dict and cached by identity.
+
+    Predictors repeatedly scan the same 20-entry priors dict; this converts
+    it to aligned arrays a single time so every later call is array indexing.
+
+    Each entry stores the keyed dict alongside its arrays: the `is` check
+    guards against a garbage-collected dict's recycled id() serving another
+    dict stale arrays, and the strong reference pins the id so it cannot be
+    reused while the entry lives.
+    """
+    key = id(priors)
+    entry = _PRIOR_ARRAYS_CACHE.get(key)
+    if entry is not None and entry[0] is priors:
+        return entry[1]
+
+    cached = {
+        'nums': np.array(list(priors.keys())),
+        'mu': np.array([p.mu for p in priors.values()], dtype=np.float64),
+        'sigma': np.array([p.sigma for p in priors.values()], dtype=np.float64),
+        'codes': np.array([p.driver_code for p in priors.values()]),
+    }
+    # Sorted-by-driver-number view: predictors that sort their input
+    # the same way can use positional mu lookups with no dict probes
+    order = np.argsort(cached['nums'], kind='stable')
+    cached['nums_sorted'] = cached['nums'][order]
+    cached['mu_sorted'] = cached['mu'][order]
+    _PRIOR_ARRAYS_CACHE[key] = (priors, cached)
+    return cached
+
+
+def _col_or_zero(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Column as a float array, or zeros if the column is absent."""
+    if col in df.columns:
+        return df[col].to_numpy(dtype=np.float64)
+    return np.zeros(len(df))
+
+
+def _mad_bounds(x: np.ndarray, n_mad: float) -> tuple:
+    """Median +/- n_mad * MAD bounds for a 1-D float array (NaNs removed)."""
+    med = np.median(x)
+    mad = np.median(np.abs(x - med))
+    return med - n_mad * mad, med + n_mad * mad
+
+
 # From cell 16
 def remove_outliers_mad(df: pd.DataFrame, feature: str, n_mad: float = 3.0) -> pd.DataFrame:
     """
@@ -25,16 +90,12 @@ def remove_outliers_mad(df: pd.DataFrame, feature: str, n_mad: float = 3.0) -> p
     pd.DataFrame
         Data with outliers removed
     """
-    values = df[feature].dropna()
-    median = values.median()
-    mad = median_abs_deviation(values, nan_policy='omit')
-    
-    # Define outlier bounds
-    lower_bound = median - n_mad * mad
-    upper_bound = median + n_mad * mad
-    
+    arr = df[feature].to_numpy(dtype=np.float64)
+    arr = arr[~np.isnan(arr)]
+    lower_bound, upper_bound = _mad_bounds(arr, n_mad)
+
     # Filter
-    mask = (df[feature] >= lower_bound) & (df[feature] <= upper_bound)
+    mask = df[feature].between(lower_bound, upper_bound)
     
     removed = len(df) - mask.sum()
     if removed > 0:
@@ -56,91 +117,48 @@ def predict_race_simple(
     track_chars should have keys like:
       'medium_corner_time_pct', 'slow_corner_time_pct', etc.
     """
-    predictions = []
-    
-    for idx, row in driver_scores.iterrows():
-        driver_num = row['driver_number']
-        
-        # Weighted sum of scores
-        testing_signal = (
-            track_chars.get('medium_corner_time_pct', 0.4) * row.get('medium_corner_score', 0) +
-            track_chars.get('slow_corner_time_pct', 0.2) * row.get('slow_corner_score', 0) +
-            track_chars.get('high_corner_time_pct', 0.2) * row.get('high_corner_score', 0) +
-            track_chars.get('straight_time_pct', 0.2) * row.get('straight_score', 0)
-        )
-        
-        # Get Bayesian prior
-        prior_mu = bayesian_priors[driver_num].mu if driver_num in bayesian_priors else 10.0
-        
-        # Combine: 90% prior, 10% testing
-        final_rating = 0.9 * prior_mu + 0.1 * testing_signal
-        
-        predictions.append({
-            'driver_number': driver_num,
-            'rating': final_rating
-        })
-    
-    df = pd.DataFrame(predictions)
-    df = df.sort_values('rating', ascending=False).reset_index(drop=True)
-    df['predicted_position'] = range(1, len(df) + 1)
-    
-    return df
+    # One up-front sort aligns the frame with the priors' sorted order
+    driver_scores = driver_scores.sort_values('driver_number', kind='stable',
+                                              ignore_index=True)
 
-
-def predict_race_fixed(
-    driver_scores: pd.DataFrame,
-    track_chars: dict,
-    bayesian_priors: dict
-) -> pd.DataFrame:
-    """
-    Fixed prediction with proper z-score normalization.
-    """
-    # Normalize scores to z-scores
-    scores_normalized = driver_scores.copy()
-    
-    score_cols = ['slow_corner_score', 'medium_corner_score', 
+    score_cols = ['slow_corner_score', 'medium_corner_score',
                   'high_corner_score', 'straight_score']
-    
-    for col in score_cols:
-        if col in scores_normalized.columns:
-            mean = scores_normalized[col].mean()
-            std = scores_normalized[col].std()
-            if std > 0:
-                scores_normalized[f'{col}_z'] = (scores_normalized[col] - mean) / std
-            else:
-                scores_normalized[f'{col}_z'] = 0
-    
-    predictions = []
-    
-    for idx, row in scores_normalized.iterrows():
-        driver_num = row['driver_number']
-        
-        # Track-weighted z-scores
-        testing_signal = (
-            track_chars.get('medium_corner_time_pct', 0.4) * row.get('medium_corner_score_z', 0) +
-            track_chars.get('slow_corner_time_pct', 0.2) * row.get('slow_corner_score_z', 0) +
-            track_chars.get('high_corner_time_pct', 0.2) * row.get('high_corner_score_z', 0) +
-            track_chars.get('straight_time_pct', 0.2) * row.get('straight_score_z', 0)
-        )
-        
-        # Get Bayesian prior
-        prior_mu = bayesian_priors[driver_num].mu if driver_num in bayesian_priors else 10.0
-        
-        # Combine: 90% prior, 10% testing
-        final_rating = 0.9 * (21 - prior_mu) + 0.1 * testing_signal
-        
-        predictions.append({
-            'driver_number': driver_num,
-            'rating': final_rating
-        })
-    
-    df = pd.DataFrame(predictions)
-    df = df.sort_values('rating').reset_index(drop=True)
-    df['predicted_position'] = range(1, len(df) + 1)
-    
+
+    # Weighted sum of scores as one (N, 4) x (4,) matrix product;
+    # column presence is resolved once here, not per cell
+    vals = np.column_stack([_col_or_zero(driver_scores, c) for c in score_cols])
+    w = np.array([
+        track_chars.get('slow_corner_time_pct', 0.2),
+        track_chars.get('medium_corner_time_pct', 0.4),
+        track_chars.get('high_corner_time_pct', 0.2),
+        track_chars.get('straight_time_pct', 0.2)
+    ])
+    testing_signal = vals @ w
+
+    # Get Bayesian priors: positional lookup when the sorted input
+    # lines up with the priors, cached LUT gather otherwise
+    driver_nums = driver_scores['driver_number'].to_numpy()
+    arrays = _prior_arrays(bayesian_priors)
+    if np.array_equal(driver_nums, arrays['nums_sorted']):
+        prior_mu = arrays['mu_sorted']
+    else:
+        lut = _mu_lut(bayesian_priors)
+        prior_mu = np.fromiter((lut.get(d, 10.0) for d in driver_nums),
+                               dtype=np.float64, count=len(driver_nums))
+
+    # Combine: 90% prior, 10% testing
+    rating = 0.9 * prior_mu + 0.1 * testing_signal
+
+    order = np.argsort(-rating, kind='stable')
+    df = pd.DataFrame({
+        'driver_number': driver_nums[order],
+        'rating': rating[order],
+        'predicted_position': np.arange(1, len(order) + 1)
+    }, copy=False)
+
     return df
 
-# From cell 17
+
 def predict_race_fixed(
     driver_scores: pd.DataFrame,
     track_chars: dict,
@@ -149,52 +167,60 @@ def predict_race_fixed(
     """
     Fixed prediction with proper z-score normalization.
     """
-    # Normalize scores to z-scores
-    scores_normalized = driver_scores.copy()
-    
-    score_cols = ['slow_corner_score', 'medium_corner_score', 
+    # One up-front sort aligns the frame with the priors' sorted order
+    driver_scores = driver_scores.sort_values('driver_number', kind='stable',
+                                              ignore_index=True)
+
+    score_cols = ['slow_corner_score', 'medium_corner_score',
                   'high_corner_score', 'straight_score']
-    
-    for col in score_cols:
-        if col in scores_normalized.columns:
-            mean = scores_normalized[col].mean()
-            std = scores_normalized[col].std()
-            if std > 0:
-                scores_normalized[f'{col}_z'] = (scores_normalized[col] - mean) / std
-            else:
-                scores_normalized[f'{col}_z'] = 0
-    
-    predictions = []
-    
-    for idx, row in scores_normalized.iterrows():
-        driver_num = row['driver_number']
-        
-        # Track-weighted z-scores
-        testing_signal = (
-            track_chars.get('medium_corner_time_pct', 0.4) * row.get('medium_corner_score_z', 0) +
-            track_chars.get('slow_corner_time_pct', 0.2) * row.get('slow_corner_score_z', 0) +
-            track_chars.get('high_corner_time_pct', 0.2) * row.get('high_corner_score_z', 0) +
-            track_chars.get('straight_time_pct', 0.2) * row.get('straight_score_z', 0)
-        )
-        
-        # Get Bayesian prior
-        prior_mu = bayesian_priors[driver_num].mu if driver_num in bayesian_priors else 10.0
-        
-        # Combine: 90% prior, 10% testing
-        final_rating = 0.9 * (21 - prior_mu) + 0.1 * testing_signal
-        
-        predictions.append({
-            'driver_number': driver_num,
-            'rating': final_rating
-        })
-    
-    df = pd.DataFrame(predictions)
-    df = df.sort_values('rating').reset_index(drop=True)
-    df['predicted_position'] = range(1, len(df) + 1)
-    
+
+    # Normalize scores to z-scores, kept as a plain array; the input
+    # frame is never copied or mutated
+    Z = np.zeros((len(driver_scores), len(score_cols)))
+    present = [(j, c) for j, c in enumerate(score_cols) if c in driver_scores.columns]
+    if present:
+        # One fused (x - mean) / std over all score columns at once
+        block = driver_scores[[c for _, c in present]].to_numpy(dtype=np.float64)
+        mean = np.nanmean(block, axis=0)
+        std = np.nanstd(block, axis=0, ddof=1)
+        degenerate = ~(std > 0)
+        std[degenerate] = 1.0
+        z = (block - mean) / std
+        z[:, degenerate] = 0.0
+        Z[:, [j for j, _ in present]] = z
+    w = np.array([
+        track_chars.get('slow_corner_time_pct', 0.2),
+        track_chars.get('medium_corner_time_pct', 0.4),
+        track_chars.get('high_corner_time_pct', 0.2),
+        track_chars.get('straight_time_pct', 0.2)
+    ])
+    testing_signal = Z @ w
+
+    # Get Bayesian priors: positional lookup when the sorted input
+    # lines up with the priors, cached LUT gather otherwise
+    driver_nums = driver_scores['driver_number'].to_numpy()
+    arrays = _prior_arrays(bayesian_priors)
+    if np.array_equal(driver_nums, arrays['nums_sorted']):
+        prior_mu = arrays['mu_sorted']
+    else:
+        lut = _mu_lut(bayesian_priors)
+        prior_mu = np.fromiter((lut.get(d, 10.0) for d in driver_nums),
+                               dtype=np.float64, count=len(driver_nums))
+
+    # Combine: 90% prior, 10% testing
+    rating = 0.9 * (21 - prior_mu) + 0.1 * testing_signal
+
+    order = np.argsort(rating, kind='stable')
+    df = pd.DataFrame({
+        'driver_number': driver_nums[order],
+        'rating': rating[order],
+        'predicted_position': np.arange(1, len(order) + 1)
+    }, copy=False)
+
     return df
 
 # From cell 22
+@functools.cache
 def initialize_2023_standings_priors() -> Dict[str, DriverPrior]:
     """
     2023 Final Championship Standings (correct priors for 2024).
@@ -243,9 +269,6 @@ def initialize_2023_standings_priors() -> Dict[str, DriverPrior]:
     
     return priors_2023
 
-# Initialize correct priors
-priors_2023 = initialize_2023_standings_priors()
-
 # From cell 17
 def predict_prior_only(bayesian_priors: dict) -> pd.DataFrame:
     """
@@ -253,21 +276,31 @@ def predict_prior_only(bayesian_priors: dict) -> pd.DataFrame:
     
     This is the "do nothing" baseline - just rank drivers by championship standings.
     """
-    predictions = []
-    
-    for driver_num, prior in bayesian_priors.items():
-        # Lower μ = better expected position
-        predictions.append({
-            'driver_number': driver_num,
-            'predicted_position': int(21 - prior.mu)
-        })
-    
-    df = pd.DataFrame(predictions)
-    df = df.sort_values('predicted_position').reset_index(drop=True)
-    
-    return df
+    # Priors never change, so the baseline frame is built once per priors
+    # dict and replayed from cache across backtest sweeps. As with
+    # _prior_arrays, the entry keeps the keyed dict so a recycled id()
+    # can never hand a fresh dict the previous dict's baseline.
+    key = id(bayesian_priors)
+    entry = _PRIOR_ONLY_CACHE.get(key)
+    if entry is not None and entry[0] is bayesian_priors:
+        return entry[1].copy()
+
+    arrays = _prior_arrays(bayesian_priors)
+
+    # Lower μ = better expected position
+    positions = (21 - arrays['mu']).astype(int)
+    order = np.argsort(positions, kind='stable')
+
+    cached = pd.DataFrame({
+        'driver_number': arrays['nums'][order],
+        'predicted_position': positions[order]
+    }, copy=False)
+    _PRIOR_ONLY_CACHE[key] = (bayesian_priors, cached)
+
+    return cached.copy()
 
 # From cell 3
+@functools.cache
 def initialize_2026_style_priors() -> Dict[str, DriverPrior]:
     """
     Initialize priors based on 2025 championship standings.
@@ -315,6 +348,3 @@ def initialize_2026_style_priors() -> Dict[str, DriverPrior]:
     
     return priors
 
-# Initialize priors
-priors = initialize_2026_style_priors()
-